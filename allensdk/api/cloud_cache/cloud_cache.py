@@ -9,6 +9,7 @@ import semver
 import tqdm
 import re
 import json
+import threading
 import warnings
 from botocore import UNSIGNED
 from botocore.client import Config
@@ -361,6 +362,10 @@ class CloudCacheBase(BasicLocalCache):
 
     _bucket_name = None
 
+    # guards reads and the read-modify-write of _downloaded_data.json
+    # when files are downloaded from several threads
+    _downloaded_data_lock = threading.Lock()
+
     def __init__(self, cache_dir, project_name, ui_class_name=None):
         super().__init__(cache_dir=cache_dir, project_name=project_name,
                          ui_class_name=ui_class_name)
@@ -634,24 +639,25 @@ class CloudCacheBase(BasicLocalCache):
             # This file does not exist; there is nothing to do
             return None
 
-        if self._downloaded_data_path.exists():
-            with open(self._downloaded_data_path, 'rb') as in_file:
-                downloaded_data = json.load(in_file)
-        else:
-            downloaded_data = {}
-
-        abs_path = str(file_attributes.local_path.resolve())
-        if abs_path in downloaded_data:
-            if downloaded_data[abs_path] == file_attributes.file_hash:
-                # this file has already been logged;
-                # there is nothing to do
-                return None
-
-        downloaded_data[abs_path] = file_attributes.file_hash
-        with open(self._downloaded_data_path, 'w') as out_file:
-            out_file.write(json.dumps(downloaded_data,
-                                      indent=2,
-                                      sort_keys=True))
+        with self._downloaded_data_lock:
+            if self._downloaded_data_path.exists():
+                with open(self._downloaded_data_path, 'rb') as in_file:
+                    downloaded_data = json.load(in_file)
+            else:
+                downloaded_data = {}
+
+            abs_path = str(file_attributes.local_path.resolve())
+            if abs_path in downloaded_data:
+                if downloaded_data[abs_path] == file_attributes.file_hash:
+                    # this file has already been logged;
+                    # there is nothing to do
+                    return None
+
+            downloaded_data[abs_path] = file_attributes.file_hash
+            with open(self._downloaded_data_path, 'w') as out_file:
+                out_file.write(json.dumps(downloaded_data,
+                                          indent=2,
+                                          sort_keys=True))
         return None
 
     def _check_for_identical_copy(self,
@@ -675,11 +681,12 @@ class CloudCacheBase(BasicLocalCache):
         -------
         bool
         """
-        if not self._downloaded_data_path.exists():
-            return False
+        with self._downloaded_data_lock:
+            if not self._downloaded_data_path.exists():
+                return False
 
-        with open(self._downloaded_data_path, 'rb') as in_file:
-            available_files = json.load(in_file)
+            with open(self._downloaded_data_path, 'rb') as in_file:
+                available_files = json.load(in_file)
 
         matched_path = None
         for abs_path in available_files:
@@ -1042,12 +1049,18 @@ class S3CloudCache(CloudCacheBase):
 
     _s3_client = None
 
+    # boto3's default session is not thread-safe, so the client must not
+    # be created by several downloading threads at once
+    _s3_client_lock = threading.Lock()
+
     @property
     def s3_client(self):
         if self._s3_client is None:
-            s3_config = Config(signature_version=UNSIGNED)
-            self._s3_client = boto3.client('s3',
-                                           config=s3_config)
+            with self._s3_client_lock:
+                if self._s3_client is None:
+                    s3_config = Config(signature_version=UNSIGNED)
+                    self._s3_client = boto3.client('s3',
+                                                   config=s3_config)
         return self._s3_client
 
     def _list_all_manifests(self) -> list:
@@ -17,11 +17,13 @@ class VisualBehaviorNeuropixelsProjectCloudApi(ProjectCloudApiBase):
 
     def _load_manifest_tables(self):
 
-        self._get_ecephys_session_table()
-        self._get_behavior_session_table()
-        self._get_unit_table()
-        self._get_probe_table()
-        self._get_channel_table()
+        self._load_tables(
+            self._get_ecephys_session_table,
+            self._get_behavior_session_table,
+            self._get_unit_table,
+            self._get_probe_table,
+            self._get_channel_table,
+        )
 
     def get_behavior_session(
         self, behavior_session_id: int
@@ -1,5 +1,18 @@
+import os
+import tempfile
+import threading
+import numpy as np
 import pandas as pd
-from typing import Iterable
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Union
+
+import allensdk
+
+try:
+    import pyarrow
+    from pyarrow import csv as pyarrow_csv
+except ImportError:
+    pyarrow = None
 
 from allensdk.brain_observatory.behavior.behavior_project_cache.project_apis.abcs import (  # noqa: E501
     BehaviorProjectBase,
@@ -17,6 +30,167 @@ from allensdk.brain_observatory.behavior.behavior_project_cache.project_apis.dat
 
 COL_EVAL_LIST = ["ophys_experiment_id", "ophys_container_id", "driver_line"]
 
+# Columns of the session and experiment tables that are read as strings,
+# and not as numbers or dates
+DATE_AND_STRING_COLUMNS = ["mouse_id", "date_of_acquisition"]
+
+# The strings that pd.read_csv reads as NaN by default
+CSV_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+]
+
+
+def _read_metadata_csv(
+    path: Union[str, Path], string_columns: Iterable[str] = ()
+) -> pd.DataFrame:
+    """Read a metadata csv and evaluate its list-valued columns.
+
+    If pyarrow is installed, its multithreaded csv reader is used instead
+    of pandas'.
+
+    Evaluating the list-valued columns calls ast.literal_eval on every
+    cell, so if pyarrow is installed the parsed table is cached as a
+    parquet file next to the csv and reused by later reads as long as it
+    is not older than the csv. The parquet file is named after the
+    versions of AllenSDK, pyarrow and pandas and the string_columns that
+    produced it. A parquet file that cannot be read is ignored and
+    rewritten.
+
+    Parameters
+    ----------
+    path: Union[str, Path]
+        path to the metadata csv
+    string_columns: Iterable[str]
+        columns to read as strings rather than infer their type
+
+    Returns
+    -------
+    pd.DataFrame
+    """
+    path = Path(path)
+    string_columns = list(string_columns)
+    if pyarrow is None:
+        df = pd.read_csv(path, dtype={c: str for c in string_columns})
+        return literal_col_eval(df, columns=COL_EVAL_LIST)
+
+    parsed_path = path.with_name(
+        f"{path.name}.parsed"
+        f".allensdk-{allensdk.__version__}"
+        f".pyarrow-{pyarrow.__version__}"
+        f".pandas-{pd.__version__}"
+        f".strings-{'+'.join(string_columns)}.parquet"
+    )
+    if (
+        parsed_path.exists()
+        and parsed_path.stat().st_mtime >= path.stat().st_mtime
+    ):
+        try:
+            return _restore_parquet_objects(pd.read_parquet(parsed_path))
+        except Exception:
+            # e.g. a truncated file; parse the csv again and overwrite it
+            pass
+
+    df = _read_csv_with_pyarrow(path, string_columns=string_columns)
+    df = literal_col_eval(df, columns=COL_EVAL_LIST)
+    _write_parquet_atomically(df, parsed_path)
+    return df
+
+
+def _restore_parquet_objects(df: pd.DataFrame) -> pd.DataFrame:
+    """Undo the conversions that a parquet round trip makes to object
+    columns: lists are read back as arrays and missing values as None"""
+    for column in df.columns:
+        if df[column].dtype == object:
+            df[column] = pd.Series(
+                [
+                    x.tolist() if isinstance(x, np.ndarray)
+                    else np.nan if x is None
+                    else x
+                    for x in df[column]
+                ],
+                index=df.index,
+                dtype=object,
+            )
+    return df
+
+
+def _read_csv_with_pyarrow(
+    path: Path, string_columns: Iterable[str] = ()
+) -> pd.DataFrame:
+    """Read a csv with pyarrow, converting it to the same frame as
+    pd.read_csv(path, dtype={c: str for c in string_columns})"""
+    column_types = {c: pyarrow.string() for c in string_columns}
+
+    def read_csv() -> "pyarrow.Table":
+        convert_options = pyarrow_csv.ConvertOptions(
+            column_types=column_types,
+            # match the strings that pandas reads as NaN
+            null_values=CSV_NA_VALUES,
+            strings_can_be_null=True,
+        )
+        return pyarrow_csv.read_csv(
+            str(path), convert_options=convert_options
+        )
+
+    table = read_csv()
+    # pandas does not infer dates and times; read them as strings instead.
+    # Known date columns should be passed as string_columns, so that the
+    # csv is only read once
+    temporal_columns = [
+        field.name
+        for field in table.schema
+        if pyarrow.types.is_temporal(field.type)
+    ]
+    if temporal_columns:
+        column_types.update({c: pyarrow.string() for c in temporal_columns})
+        table = read_csv()
+
+    # pandas reads empty columns as float NaN, rather than None
+    null_columns = [
+        i
+        for i, field in enumerate(table.schema)
+        if pyarrow.types.is_null(field.type)
+    ]
+    for i in null_columns:
+        table = table.set_column(
+            i, table.field(i).with_type(pyarrow.float64()),
+            table.column(i).cast(pyarrow.float64())
+        )
+
+    df = table.to_pandas()
+    # pandas reads missing values in object columns (e.g. strings or
+    # booleans) as NaN, rather than None
+    for column in df.columns:
+        if df[column].dtype == object and df[column].hasnans:
+            df[column] = df[column].where(df[column].notnull(), np.nan)
+    return df
+
+
+def _write_parquet_atomically(df: pd.DataFrame, path: Path):
+    """Write df as parquet to a temporary file next to path and move it
+    into place, so that concurrent or interrupted writes never leave a
+    partial file at path. Failures are ignored, as the cache directory
+    may not be writable and columns mixing lists and scalars cannot be
+    written as parquet; the csv is then simply parsed again on the next
+    read"""
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=path.parent, prefix=f"{path.name}.", suffix=".tmp"
+        )
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            df.to_parquet(f)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
 
 class BehaviorProjectCloudApi(BehaviorProjectBase, ProjectCloudApiBase):
 
@@ -42,10 +216,60 @@ class BehaviorProjectCloudApi(BehaviorProjectBase, ProjectCloudApiBase):
                 f"but it has {cache_metadata}"
             )
 
-        self._get_ophys_session_table()
-        self._get_behavior_session_table()
-        self._get_ophys_experiment_table()
-        self._get_ophys_cells_table()
+        # The tables are downloaded and parsed on first access, so that
+        # callers only pay for the tables they use. Drop any tables read
+        # from a previously loaded manifest.
+        self._metadata_tables = dict()
+        # A table may be requested from several threads at once, e.g. by
+        # the thread that prefetches data files; each table is loaded
+        # under its own lock so that it is only loaded once
+        self._metadata_table_locks = {
+            name: threading.Lock() for name in expected_metadata
+        }
+
+    def load_metadata_tables(self):
+        """Download and parse all metadata tables now, rather than when
+        each is first requested. The tables are loaded concurrently."""
+        self._load_tables(
+            lambda: self._ophys_session_table,
+            lambda: self._behavior_session_table,
+            lambda: self._ophys_experiment_table,
+            lambda: self._ophys_cells_table,
+        )
+
+    def _get_metadata_table(
+        self, name: str, loader: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """Return the metadata table called name, loading it with loader
+        the first time it is requested"""
+        with self._metadata_table_locks[name]:
+            if name not in self._metadata_tables:
+                self._metadata_tables[name] = loader()
+            return self._metadata_tables[name]
+
+    @property
+    def _ophys_session_table(self) -> pd.DataFrame:
+        return self._get_metadata_table(
+            "ophys_session_table", self._get_ophys_session_table
+        )
+
+    @property
+    def _behavior_session_table(self) -> pd.DataFrame:
+        return self._get_metadata_table(
+            "behavior_session_table", self._get_behavior_session_table
+        )
+
+    @property
+    def _ophys_experiment_table(self) -> pd.DataFrame:
+        return self._get_metadata_table(
+            "ophys_experiment_table", self._get_ophys_experiment_table
+        )
+
+    @property
+    def _ophys_cells_table(self) -> pd.DataFrame:
+        return self._get_metadata_table(
+            "ophys_cells_table", self._get_ophys_cells_table
+        )
 
     def get_behavior_session(
         self, behavior_session_id: int
@@ -74,25 +298,50 @@ class BehaviorProjectCloudApi(BehaviorProjectBase, ProjectCloudApiBase):
         from the nwb file for the first-listed ophys_experiment.
 
         """
-        row = self._behavior_session_table.query(
-            f"behavior_session_id=={behavior_session_id}"
+        data_path = self._get_behavior_session_data_path(
+            behavior_session_id=behavior_session_id
+        )
+        return BehaviorSession.from_nwb_path(nwb_path=str(data_path))
+
+    def get_behavior_sessions(
+        self, behavior_session_ids: Iterable[int]
+    ) -> Iterator[BehaviorSession]:
+        """get BehaviorSessions for several behavior_session_ids, downloading
+        the nwb file of the next session while the current one is read
+
+        Parameters
+        ----------
+        behavior_session_ids: Iterable[int]
+            the ids of the behavior_sessions
+
+        Returns
+        -------
+        Iterator[BehaviorSession]
+            the sessions, in the order of behavior_session_ids
+
+        Notes
+        -----
+        see get_behavior_session
+        """
+        for data_path in self._iter_prefetched(
+            self._get_behavior_session_data_path, behavior_session_ids
+        ):
+            yield BehaviorSession.from_nwb_path(nwb_path=str(data_path))
+
+    def _get_behavior_session_data_path(self, behavior_session_id: int):
+        """get the local path to the nwb file of a behavior session,
+        downloading it if necessary. See get_behavior_session"""
+        row = self._get_unique_row(
+            table=self._behavior_session_table,
+            table_name="behavior_session_table",
+            index_value=behavior_session_id,
         )
-        if row.shape[0] != 1:
-            raise RuntimeError(
-                "The behavior_session_table should have "
-                "1 and only 1 entry for a given "
-                "behavior_session_id. For "
-                f"{behavior_session_id} "
-                f" there are {row.shape[0]} entries."
-            )
-        row = row.squeeze()
         has_file_id = not pd.isna(row[self.cache.file_id_column])
         if not has_file_id:
             oeid = row.ophys_experiment_id[0]
-            row = self._ophys_experiment_table.query(f"index=={oeid}")
+            row = self._ophys_experiment_table.loc[oeid]
         file_id = str(int(row[self.cache.file_id_column]))
-        data_path = self._get_data_path(file_id=file_id)
-        return BehaviorSession.from_nwb_path(nwb_path=str(data_path))
+        return self._get_data_path(file_id=file_id)
 
     def get_behavior_ophys_experiment(
         self, ophys_experiment_id: int
@@ -109,31 +358,97 @@ class BehaviorProjectCloudApi(BehaviorProjectBase, ProjectCloudApiBase):
         BehaviorOphysExperiment
 
         """
-        row = self._ophys_experiment_table.query(
-            f"index=={ophys_experiment_id}"
+        data_path = self._get_behavior_ophys_experiment_data_path(
+            ophys_experiment_id=ophys_experiment_id
         )
-        if row.shape[0] != 1:
+        return BehaviorOphysExperiment.from_nwb_path(str(data_path))
+
+    def get_behavior_ophys_experiments(
+        self, ophys_experiment_ids: Iterable[int]
+    ) -> Iterator[BehaviorOphysExperiment]:
+        """get BehaviorOphysExperiments for several ophys_experiment_ids,
+        downloading the nwb file of the next experiment while the current
+        one is read
+
+        Parameters
+        ----------
+        ophys_experiment_ids: Iterable[int]
+            the ids of the ophys_experiments
+
+        Returns
+        -------
+        Iterator[BehaviorOphysExperiment]
+            the experiments, in the order of ophys_experiment_ids
+
+        """
+        for data_path in self._iter_prefetched(
+            self._get_behavior_ophys_experiment_data_path, ophys_experiment_ids
+        ):
+            yield BehaviorOphysExperiment.from_nwb_path(str(data_path))
+
+    def _get_behavior_ophys_experiment_data_path(
+        self, ophys_experiment_id: int
+    ):
+        """get the local path to the nwb file of an ophys experiment,
+        downloading it if necessary"""
+        row = self._get_unique_row(
+            table=self._ophys_experiment_table,
+            table_name="behavior_ophys_experiment_table",
+            index_value=ophys_experiment_id,
+        )
+        file_id = str(int(row[self.cache.file_id_column]))
+        return self._get_data_path(file_id=file_id)
+
+    @staticmethod
+    def _get_unique_row(
+        table: pd.DataFrame, table_name: str, index_value: int
+    ) -> pd.Series:
+        """Look up the single row of a table indexed by id
+
+        Parameters
+        ----------
+        table: pd.DataFrame
+            table indexed by id
+        table_name: str
+            name of the table, used in error messages
+        index_value: int
+            the id to look up
+
+        Returns
+        -------
+        pd.Series
+            the row of the table
+
+        Raises
+        ------
+        RuntimeError
+            if there is not exactly 1 row for index_value
+        """
+        try:
+            row = table.loc[index_value]
+        except KeyError:
+            n_rows = 0
+        else:
+            n_rows = 1 if isinstance(row, pd.Series) else row.shape[0]
+        if n_rows != 1:
             raise RuntimeError(
-                "The behavior_ophys_experiment_table should "
-                "have 1 and only 1 entry for a given "
-                f"ophys_experiment_id. For "
-                f"{ophys_experiment_id} "
-                f" there are {row.shape[0]} entries."
+                f"The {table_name} should have "
+                "1 and only 1 entry for a given "
+                f"{table.index.name}. For "
+                f"{index_value} "
+                f" there are {n_rows} entries."
             )
-        file_id = str(int(row[self.cache.file_id_column]))
-        data_path = self._get_data_path(file_id=file_id)
-        return BehaviorOphysExperiment.from_nwb_path(str(data_path))
+        return row
 
-    def _get_ophys_session_table(self):
+    def _get_ophys_session_table(self) -> pd.DataFrame:
         session_table_path = self._get_metadata_path(
             fname="ophys_session_table"
         )
-        df = literal_col_eval(
-            pd.read_csv(session_table_path, dtype={"mouse_id": str}),
-            columns=COL_EVAL_LIST,
+        df = _read_metadata_csv(
+            session_table_path, string_columns=DATE_AND_STRING_COLUMNS
         )
         df["date_of_acquisition"] = pd.to_datetime(df["date_of_acquisition"])
-        self._ophys_session_table = df.set_index("ophys_session_id")
+        return df.set_index("ophys_session_id")
 
     def get_ophys_session_table(self) -> pd.DataFrame:
         """Return a pd.Dataframe table summarizing ophys_sessions
@@ -148,17 +463,16 @@ class BehaviorProjectCloudApi(BehaviorProjectBase, ProjectCloudApiBase):
         """
         return self._ophys_session_table
 
-    def _get_behavior_session_table(self):
+    def _get_behavior_session_table(self) -> pd.DataFrame:
         session_table_path = self._get_metadata_path(
             fname="behavior_session_table"
         )
-        df = literal_col_eval(
-            pd.read_csv(session_table_path, dtype={"mouse_id": str}),
-            columns=COL_EVAL_LIST,
+        df = _read_metadata_csv(
+            session_table_path, string_columns=DATE_AND_STRING_COLUMNS
         )
         df["date_of_acquisition"] = pd.to_datetime(df["date_of_acquisition"])
 
-        self._behavior_session_table = df.set_index("behavior_session_id")
+        return df.set_index("behavior_session_id")
 
     def get_behavior_session_table(self) -> pd.DataFrame:
         """Return a pd.Dataframe table with both behavior-only
@@ -177,30 +491,27 @@ class BehaviorProjectCloudApi(BehaviorProjectBase, ProjectCloudApiBase):
         """
         return self._behavior_session_table
 
-    def _get_ophys_experiment_table(self):
+    def _get_ophys_experiment_table(self) -> pd.DataFrame:
         experiment_table_path = self._get_metadata_path(
             fname="ophys_experiment_table"
         )
-        df = literal_col_eval(
-            pd.read_csv(experiment_table_path, dtype={"mouse_id": str}),
-            columns=COL_EVAL_LIST,
+        df = _read_metadata_csv(
+            experiment_table_path, string_columns=DATE_AND_STRING_COLUMNS
         )
         df["date_of_acquisition"] = pd.to_datetime(df["date_of_acquisition"])
 
-        self._ophys_experiment_table = df.set_index("ophys_experiment_id")
+        return df.set_index("ophys_experiment_id")
 
-    def _get_ophys_cells_table(self):
+    def _get_ophys_cells_table(self) -> pd.DataFrame:
         ophys_cells_table_path = self._get_metadata_path(
             fname="ophys_cells_table"
         )
-        df = literal_col_eval(
-            pd.read_csv(ophys_cells_table_path), columns=COL_EVAL_LIST
-        )
+        df = _read_metadata_csv(ophys_cells_table_path)
         # NaN's for invalid cells force this to float, push to int
         df["cell_specimen_id"] = pd.array(
             df["cell_specimen_id"], dtype="Int64"
         )
-        self._ophys_cells_table = df.set_index("cell_roi_id")
+        return df.set_index("cell_roi_id")
 
     def get_ophys_cells_table(self):
         return self._ophys_cells_table
@@ -1,4 +1,5 @@
-from typing import Union, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Union, Optional
 from pathlib import Path
 import logging
 
@@ -6,7 +7,7 @@ from allensdk.api.cloud_cache.cloud_cache import (
     S3CloudCache, LocalCache, StaticLocalCache)
 
 from allensdk.brain_observatory.behavior.behavior_project_cache \
-    .utils import version_check
+    .utils import version_check, BehaviorCloudCacheVersionException
 
 
 class ProjectCloudApiBase(object):
@@ -26,6 +27,10 @@ class ProjectCloudApiBase(object):
         Whether to operate in local mode, where no data will be downloaded
         and instead will be loaded from local
     """
+
+    # Whether the metadata tables are downloaded and parsed concurrently
+    CONCURRENT_TABLE_LOADING = True
+
     def __init__(
         self,
         cache: Union[S3CloudCache, LocalCache, StaticLocalCache],
@@ -59,8 +64,7 @@ class ProjectCloudApiBase(object):
                                f"manifest file: {self.cache._manifest_name}")
 
         if not self.skip_version_check:
-            data_sdk_version = [i for i in self.cache._manifest._data_pipeline
-                                if i['name'] == "AllenSDK"][0]["version"]
+            data_sdk_version = self._get_data_sdk_version()
             version_check(
                 self.cache._manifest.version,
                 data_sdk_version,
@@ -71,10 +75,94 @@ class ProjectCloudApiBase(object):
 
         self._load_manifest_tables()
 
+    def _get_data_sdk_version(self) -> str:
+        """Return the version of AllenSDK that was used to release the
+        data, as listed in the data pipeline of the loaded manifest
+
+        Raises
+        ------
+        BehaviorCloudCacheVersionException
+            if the data pipeline does not list exactly 1 AllenSDK entry
+        """
+        sdk_entry = None
+        for entry in self.cache._manifest._data_pipeline:
+            if entry['name'] == "AllenSDK":
+                if sdk_entry is not None:
+                    raise BehaviorCloudCacheVersionException(
+                        "expected 1 AllenSDK entry in the data pipeline of "
+                        f"manifest {self.cache._manifest_name}, found >1")
+                sdk_entry = entry
+        if sdk_entry is None:
+            raise BehaviorCloudCacheVersionException(
+                "expected 1 AllenSDK entry in the data pipeline of "
+                f"manifest {self.cache._manifest_name}, found 0")
+        return sdk_entry["version"]
+
     def _load_manifest_tables(self):
 
         raise NotImplementedError
 
+    def _load_tables(self, *loaders: Callable[[], None]):
+        """Run the given table loaders, each of which downloads and parses
+        one metadata table. The loaders are independent, so unless
+        CONCURRENT_TABLE_LOADING is False they are run in a thread pool to
+        overlap their downloads.
+
+        Parameters
+        ----------
+        loaders: Callable[[], None]
+            the table loaders, e.g. self._get_ophys_session_table
+        """
+        if not self.CONCURRENT_TABLE_LOADING:
+            for loader in loaders:
+                loader()
+            return
+
+        with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+            futures = [executor.submit(loader) for loader in loaders]
+            # re-raise any exception from the loaders
+            for future in futures:
+                future.result()
+
+    @staticmethod
+    def _iter_prefetched(
+        get_data_path: Callable[[Any], Path], ids: Iterable[Any]
+    ) -> Iterator[Path]:
+        """Yield get_data_path(id) for each id, calling it for the next id
+        in a background thread while the caller processes the current
+        path, so that downloading the next data file overlaps with reading
+        the current one.
+
+        Parameters
+        ----------
+        get_data_path: Callable[[Any], Path]
+            returns the local path to the data file for an id,
+            downloading it if necessary
+        ids: Iterable[Any]
+            the ids of the data files
+
+        Returns
+        -------
+        Iterator[Path]
+            the local paths, in the order of ids
+        """
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = None
+        try:
+            for next_id in ids:
+                previous_future = future
+                future = executor.submit(get_data_path, next_id)
+                if previous_future is not None:
+                    yield previous_future.result()
+            if future is not None:
+                yield future.result()
+        finally:
+            # If the caller stops iterating early or a download fails, do
+            # not wait for a prefetch that is no longer needed
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     @classmethod
     def from_s3_cache(cls, cache_dir: Union[str, Path],
                       bucket_name: str,
@@ -17,7 +17,10 @@ class ProjectTable(ABC):
             columns to drop from table
 
         """
-        self._df = df
+        # Postprocessing adds, replaces and drops columns; a shallow copy
+        # keeps that from modifying the caller's frame without copying
+        # the data
+        self._df = df.copy(deep=False)
 
         if suppress is not None:
             suppress = list(suppress)
@@ -31,8 +34,11 @@ class ProjectTable(ABC):
 
     def postprocess_base(self):
         """Postprocessing to apply to all project-level data"""
-        # Make sure the index is not duplicated (it is rare)
-        self._df = self._df[~self._df.index.duplicated()].copy()
+        # Make sure the index is not duplicated (it is rare, so only
+        # copy the table when there are duplicates to drop)
+        duplicated = self._df.index.duplicated()
+        if duplicated.any():
+            self._df = self._df[~duplicated].copy()
 
     def postprocess(self):
         """Postprocess loop"""
@@ -40,8 +46,8 @@ class ProjectTable(ABC):
         self.postprocess_additional()
 
         if self._suppress:
-            self._df.drop(columns=self._suppress, inplace=True,
-                          errors="ignore")
+            self._df = self._df.drop(columns=self._suppress,
+                                     errors="ignore")
 
     @abstractmethod
     def postprocess_additional(self):
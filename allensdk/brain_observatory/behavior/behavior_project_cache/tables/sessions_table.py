@@ -1,5 +1,5 @@
 import re
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import pandas as pd
 from allensdk.brain_observatory.behavior.behavior_project_cache.project_apis.data_io import (  # noqa: E501
@@ -38,6 +38,22 @@ from allensdk.internal.brain_observatory.util.multi_session_utils import (
     multiprocessing_helper,
 )
 
+# Session number of ophys session types, e.g. 1 for "OPHYS_1_images_A"
+_OPHYS_SESSION_NUMBER_PATTERN = re.compile(r"^OPHYS_(\d+)")
+
+
+def _map_unique(series: pd.Series, func: Callable[[Any], Any]) -> pd.Series:
+    """Apply func once per distinct value of series and broadcast the
+    result back to every row, rather than calling func once per row.
+
+    Falls back to a per-row apply if the values are not hashable
+    (e.g. lists aggregated from LIMS)"""
+    try:
+        parsed = {value: func(value) for value in series.unique()}
+    except TypeError:
+        return series.apply(func)
+    return series.map(parsed)
+
 
 class SessionsTable(ProjectTable, OphysMixin):
     """Class for storing and manipulating project-level data
@@ -75,14 +91,18 @@ class SessionsTable(ProjectTable, OphysMixin):
 
     def postprocess_additional(self):
         # Add subject metadata
-        self._df["reporter_line"] = self._df["reporter_line"].apply(
-            ReporterLine.parse
+        # Genotype strings repeat heavily across sessions, so parse each
+        # distinct value only once
+        self._df["reporter_line"] = _map_unique(
+            self._df["reporter_line"], ReporterLine.parse
         )
-        self._df["cre_line"] = self._df["full_genotype"].apply(
-            lambda x: FullGenotype(x).parse_cre_line()
+        self._df["cre_line"] = _map_unique(
+            self._df["full_genotype"],
+            lambda x: FullGenotype(x).parse_cre_line(),
         )
-        self._df["indicator"] = self._df["reporter_line"].apply(
-            lambda x: ReporterLine(x).parse_indicator()
+        self._df["indicator"] = _map_unique(
+            self._df["reporter_line"],
+            lambda x: ReporterLine(x).parse_indicator(),
         )
 
         # add session number
@@ -146,20 +166,15 @@ class SessionsTable(ProjectTable, OphysMixin):
 
     def __add_session_number(self):
         """Parses session number from session type and and adds to dataframe"""
-
-        def parse_session_number(session_type: str):
-            """Parse the session number from session type"""
-            match = re.match(r"OPHYS_(?P<session_number>\d+)", session_type)
-            if match is None:
-                return None
-            return int(match.group("session_number"))
-
-        session_type = self._df["session_type"]
-        session_type = session_type[session_type.notnull()]
-
-        self._df.loc[
-            session_type.index, "session_number"
-        ] = session_type.apply(parse_session_number)
+        # Vectorized regex extraction; non-matching and null session types
+        # yield NA. Cast to str so that an all-null column still supports
+        # the .str accessor
+        session_number = self._df["session_type"].astype(str).str.extract(
+            _OPHYS_SESSION_NUMBER_PATTERN, expand=False
+        )
+        self._df["session_number"] = pd.to_numeric(
+            session_number, errors="coerce"
+        ).astype("Int64")
 
     @staticmethod
     def _get_trial_metrics_helper(*args) -> Dict:
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import semver
 
 
@@ -5,15 +7,28 @@ class BehaviorCloudCacheVersionException(Exception):
     pass
 
 
+@lru_cache(maxsize=None)
+def _parse_version(version: str) -> semver.VersionInfo:
+    """Parse a semantic version string, caching the result since the same
+    few versions are checked every time a cloud cache is loaded"""
+    return semver.VersionInfo.parse(version)
+
+
 def version_check(manifest_version: str,
                   data_pipeline_version: str,
                   cmin: str,
                   cmax: str):
-    mver_parsed = semver.VersionInfo.parse(manifest_version)
-    cmin_parsed = semver.VersionInfo.parse(cmin)
-    cmax_parsed = semver.VersionInfo.parse(cmax)
+    try:
+        mver_parsed = _parse_version(manifest_version)
+    except ValueError:
+        raise BehaviorCloudCacheVersionException(
+            f"the manifest has manifest_version {manifest_version}, which is "
+            "not a valid semantic version. The data was released with "
+            f"AllenSDK {data_pipeline_version}")
+    cmin_parsed = _parse_version(cmin)
+    cmax_parsed = _parse_version(cmax)
 
-    if (mver_parsed < cmin_parsed) | (mver_parsed >= cmax_parsed):
+    if mver_parsed < cmin_parsed or mver_parsed >= cmax_parsed:
         estr = (f"the manifest has manifest_version {manifest_version} but "
                 "this version of AllenSDK is compatible only with manifest "
                 f"versions {cmin} <= X < {cmax}. \n"
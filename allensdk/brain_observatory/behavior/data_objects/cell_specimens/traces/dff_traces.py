@@ -1,5 +1,8 @@
+from typing import Optional, Tuple
+
 import pandas as pd
 import numpy as np
+from hdmf.backends.hdf5 import H5DataIO
 from pynwb import NWBFile
 from pynwb.ophys import DfOverF
 
@@ -16,6 +19,24 @@ from allensdk.brain_observatory.behavior.data_objects.timestamps\
     .ophys_timestamps import \
     OphysTimestamps
 
+# Size of the HDF5 chunks that dff traces are written to NWB in. Chunks
+# span at most DFF_TRACES_CHUNK_ROIS rois, so that reading one roi's trace
+# does not read every roi, and fit in HDF5's default 1 MiB chunk cache
+DFF_TRACES_CHUNK_BYTES = 2 ** 20
+DFF_TRACES_CHUNK_ROIS = 32
+
+
+def _get_chunk_shape(trace_data: np.ndarray) -> Optional[Tuple[int, int]]:
+    """Return the HDF5 chunk shape for timepoints x rois trace data, or
+    None if the data is empty and cannot be chunked"""
+    n_timepoints, n_rois = trace_data.shape
+    if n_timepoints == 0 or n_rois == 0:
+        return None
+    chunk_rois = min(n_rois, DFF_TRACES_CHUNK_ROIS)
+    chunk_timepoints = max(
+        1, DFF_TRACES_CHUNK_BYTES // (trace_data.itemsize * chunk_rois))
+    return min(n_timepoints, chunk_timepoints), chunk_rois
+
 
 class DFFTraces(DataObject, RoisMixin,
                 DataFileReadableInterface, NwbReadableInterface,
@@ -36,9 +57,13 @@ class DFFTraces(DataObject, RoisMixin,
         dff_traces = self.value[['dff']]
 
         ophys_module = nwbfile.processing['ophys']
-        # trace data in the form of rois x timepoints
-        trace_data = np.array([dff_traces.loc[cell_roi_id].dff
-                               for cell_roi_id in dff_traces.index.values])
+        # Stack each roi's trace as a column so that the trace data is
+        # laid out contiguously as timepoints x rois, as stored in NWB
+        if len(dff_traces) > 0:
+            trace_data = np.stack(dff_traces['dff'].values, axis=1)
+        else:
+            # np.stack needs at least one trace
+            trace_data = np.empty((len(ophys_timestamps.value), 0))
 
         cell_specimen_table = nwbfile.processing['ophys'].data_interfaces[
             'image_segmentation'].plane_segmentations[
@@ -54,7 +79,7 @@ class DFFTraces(DataObject, RoisMixin,
 
         dff_interface.create_roi_response_series(
             name='traces',
-            data=trace_data.T,  # Should be stored as timepoints x rois
+            data=H5DataIO(trace_data, chunks=_get_chunk_shape(trace_data)),
             unit='NA',
             rois=roi_table_region,
             timestamps=ophys_timestamps.value)
@@ -67,10 +92,11 @@ class DFFTraces(DataObject, RoisMixin,
             dff_nwb = nwbfile.processing[
                 'ophys'].data_interfaces['dff'].roi_response_series['traces']
             # dff traces stored as timepoints x rois in NWB
-            # We want rois x timepoints, hence the transpose
+            # We want rois x timepoints, hence the transpose. Each roi's
+            # trace is a view into the block that was read, not a copy
             dff_traces = dff_nwb.data[:].T
 
-            df = pd.DataFrame({'dff': [x for x in dff_traces]},
+            df = pd.DataFrame({'dff': list(dff_traces)},
                               index=pd.Index(data=dff_nwb.rois.table.id[:],
                                              name='cell_roi_id'))
             return DFFTraces(traces=df)
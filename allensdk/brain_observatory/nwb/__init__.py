@@ -932,9 +932,13 @@ def add_dff_traces(nwbfile, dff_traces, ophys_timestamps):
     dff_traces = dff_traces.reset_index().set_index('cell_roi_id')[['dff']]
 
     ophys_module = nwbfile.processing['ophys']
-    # trace data in the form of rois x timepoints
-    trace_data = np.array([dff_traces.loc[cell_roi_id].dff
-                           for cell_roi_id in dff_traces.index.values])
+    # Stack each roi's trace as a column so that the trace data is
+    # laid out contiguously as timepoints x rois, as stored in NWB
+    if len(dff_traces) > 0:
+        trace_data = np.stack(dff_traces['dff'].values, axis=1)
+    else:
+        # np.stack needs at least one trace
+        trace_data = np.empty((len(ophys_timestamps), 0))
 
     cell_specimen_table = nwbfile.processing['ophys'].data_interfaces['image_segmentation'].plane_segmentations['cell_specimen_table']  # noqa: E501
     roi_table_region = cell_specimen_table.create_roi_table_region(
@@ -948,7 +952,7 @@ def add_dff_traces(nwbfile, dff_traces, ophys_timestamps):
 
     dff_interface.create_roi_response_series(
         name='traces',
-        data=trace_data.T,  # Should be stored as timepoints x rois
+        data=trace_data,
         unit='NA',
         rois=roi_table_region,
         timestamps=ophys_timestamps)
@@ -964,20 +968,25 @@ def add_corrected_fluorescence_traces(nwbfile, corrected_fluorescence_traces):
     # Create/Add corrected_fluorescence_traces modules and interfaces:
     assert corrected_fluorescence_traces.index.name == 'cell_roi_id'
     ophys_module = nwbfile.processing['ophys']
-    # trace data in the form of rois x timepoints
-    f_trace_data = np.array(
-        [corrected_fluorescence_traces.loc[cell_roi_id].corrected_fluorescence
-         for cell_roi_id in corrected_fluorescence_traces.index.values])
-
-    roi_table_region = nwbfile.processing['ophys'].data_interfaces['dff'].roi_response_series['traces'].rois  # noqa: E501
     ophys_timestamps = ophys_module.get_data_interface(
             'dff').roi_response_series['traces'].timestamps
+    # Stack each roi's trace as a column so that the trace data is
+    # laid out contiguously as timepoints x rois, as stored in NWB
+    if len(corrected_fluorescence_traces) > 0:
+        f_trace_data = np.stack(
+            corrected_fluorescence_traces['corrected_fluorescence'].values,
+            axis=1)
+    else:
+        # np.stack needs at least one trace
+        f_trace_data = np.empty((len(ophys_timestamps), 0))
+
+    roi_table_region = nwbfile.processing['ophys'].data_interfaces['dff'].roi_response_series['traces'].rois  # noqa: E501
     f_interface = Fluorescence(name='corrected_fluorescence')
     ophys_module.add_data_interface(f_interface)
 
     f_interface.create_roi_response_series(
         name='traces',
-        data=f_trace_data.T,  # Should be stored as timepoints x rois
+        data=f_trace_data,
         unit='NA',
         rois=roi_table_region,
         timestamps=ophys_timestamps)
@@ -4,6 +4,11 @@ import gzip
 import pathlib
 
 
+# Only these types need to be descended into or decoded by
+# _sanitize_list; everything else is left as is
+_SANITIZED_TYPES = (list, tuple, dict, bytes)
+
+
 def load_and_sanitize_pickle(
         pickle_path: Union[str, pathlib.Path]) -> Any:
     """
@@ -77,14 +82,16 @@ def _sanitize_list(
     Alters raw_data in place
     """
     for idx, element in enumerate(raw_data):
-        if isinstance(element, list) or isinstance(element, tuple):
+        # Stimulus pickles contain long lists of numbers; skip them
+        # with a single type check
+        if not isinstance(element, _SANITIZED_TYPES):
+            continue
+        elif isinstance(element, (list, tuple)):
             raw_data[idx] = _sanitize_list_or_tuple(element)
         elif isinstance(element, dict):
             raw_data[idx] = _sanitize_dict(element)
-        elif isinstance(element, bytes):
-            raw_data[idx] = element.decode('utf-8')
         else:
-            pass
+            raw_data[idx] = element.decode('utf-8')
 
     return raw_data
 
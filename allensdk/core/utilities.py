@@ -1,18 +1,75 @@
 import ast
+import json
+import re
 import pandas as pd
-from typing import List
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+from typing import Any, List
 
 # Utils for processing dataframes
 
+# An integer, e.g. "123", or a flat list of integers, e.g. "[123, 456]".
+# These are valid JSON, which the C-accelerated json decoder parses much
+# faster than ast.literal_eval
+_INT = r"-?(?:0|[1-9]\d*)"
+_INT_PATTERN = re.compile(_INT)
+_INT_LIST_PATTERN = re.compile(rf"\[\s*{_INT}(?:\s*,\s*{_INT})*\s*\]")
+
+# Evaluated values of these types can be shared between rows
+_IMMUTABLE_TYPES = (int, float, complex, bool, str, bytes, type(None))
+
+
+def _literal_eval(value: Any) -> Any:
+    """ast.literal_eval string values, with a fast path for integers and
+    flat lists of integers, which are by far the most common entries in
+    metadata tables. Non-string values are returned as is"""
+    if not isinstance(value, str):
+        return value
+    if _INT_PATTERN.fullmatch(value):
+        return int(value)
+    if _INT_LIST_PATTERN.fullmatch(value):
+        return json.loads(value)
+    return ast.literal_eval(value)
+
+
+def _literal_eval_column(values: pd.Series) -> pd.Series:
+    """_literal_eval the string entries of values, leaving other entries
+    as is. List-valued columns repeat few distinct strings, so each
+    distinct string is evaluated only once; every row still gets its own
+    list, as if it had been evaluated separately"""
+    # maps a string to (copy, cached): the row's value is copy(cached),
+    # or cached itself if copy is None
+    cache = dict()
+    evaluated = []
+    for value in values:
+        if not isinstance(value, str):
+            evaluated.append(value)
+            continue
+        try:
+            copy, cached = cache[value]
+        except KeyError:
+            result = _literal_eval(value)
+            if isinstance(result, _IMMUTABLE_TYPES):
+                copy, cached = None, result
+            elif isinstance(result, list) and all(
+                    isinstance(x, _IMMUTABLE_TYPES) for x in result):
+                copy, cached = list, tuple(result)
+            else:
+                # e.g. nested lists; evaluate again for every row
+                copy, cached = _literal_eval, value
+            cache[value] = (copy, cached)
+        evaluated.append(cached if copy is None else copy(cached))
+    return pd.Series(evaluated, index=values.index, dtype=object)
+
 
 def literal_col_eval(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
     """Eval string entries of specified columns"""
 
     for column in columns:
-        if column in df.columns:
-            df.loc[df[column].notnull(), column] = df[column][
-                df[column].notnull()
-            ].apply(lambda x: ast.literal_eval(x) if isinstance(x, str) else x)
+        # numeric/boolean/datetime columns hold no strings to evaluate
+        if column in df.columns and not (
+                is_numeric_dtype(df[column]) or
+                is_datetime64_any_dtype(df[column])):
+            df[column] = _literal_eval_column(df[column])
     return df
 
 
@@ -1,3 +1,6 @@
+import threading
+import time
+
 import pytest
 import pandas as pd
 from pathlib import Path
@@ -126,6 +129,9 @@ def test_BehaviorProjectCloudApi(mock_cache, monkeypatch, local):
                                                skip_version_check=True,
                                                local=True)
 
+    # tables are only loaded once they are requested
+    assert len(api._metadata_tables) == 0
+
     # behavior session table as expected
     bost = api.get_behavior_session_table()
     assert bost.index.name == "behavior_session_id"
@@ -161,18 +167,73 @@ def test_BehaviorProjectCloudApi(mock_cache, monkeypatch, local):
     monkeypatch.setattr(cloudapi.BehaviorSession, "from_nwb_path", mock_nwb)
     assert api.get_behavior_session(2) == "5"
     assert api.get_behavior_session(4) == "7"
+    assert list(api.get_behavior_sessions([2, 4, 1])) == ["5", "7", "4"]
 
     # direct check only for ophys experiment
     monkeypatch.setattr(cloudapi.BehaviorOphysExperiment,
                         "from_nwb_path", mock_nwb)
     assert api.get_behavior_ophys_experiment(8) == "8"
+    assert list(api.get_behavior_ophys_experiments([8, 4])) == ["8", "4"]
+    assert list(api.get_behavior_ophys_experiments([])) == []
+
+    # loading all tables concurrently gives the same tables
+    loaded_tables = dict(api._metadata_tables)
+    api._metadata_tables.clear()
+    api.load_metadata_tables()
+    assert set(api._metadata_tables) == set(
+        mocked_cache._manifest.metadata_file_names)
+    for name, table in loaded_tables.items():
+        pd.testing.assert_frame_equal(api._metadata_tables[name], table)
+
+
+def test_iter_prefetched_early_exit():
+    """Stopping the iteration does not wait for the prefetched download"""
+    release = threading.Event()
+    requested = []
+
+    def get_data_path(data_id):
+        requested.append(data_id)
+        if data_id == 2:
+            release.wait(timeout=10)
+        return data_id
+
+    paths = cloudapibase.ProjectCloudApiBase._iter_prefetched(
+        get_data_path, [1, 2, 3])
+    try:
+        assert next(paths) == 1
+        start = time.monotonic()
+        paths.close()
+        assert time.monotonic() - start < 5
+    finally:
+        release.set()
+    assert 3 not in requested
+
+
+def test_iter_prefetched_exception():
+    """An exception for one id is raised once the previous ids are
+    yielded, and the remaining ids are not downloaded"""
+    requested = []
+
+    def get_data_path(data_id):
+        requested.append(data_id)
+        if data_id == 2:
+            raise ValueError("download failed")
+        return data_id
+
+    paths = cloudapibase.ProjectCloudApiBase._iter_prefetched(
+        get_data_path, [1, 2, 3, 4])
+    assert next(paths) == 1
+    with pytest.raises(ValueError, match="download failed"):
+        next(paths)
+    assert 4 not in requested
 
 
 @pytest.mark.parametrize(
         "manifest_version, data_pipeline_version, cmin, cmax, exception",
         [
             ("0.0.1", "2.9.0", "0.0.0", "1.0.0", False),
-            ("1.0.1", "2.9.0", "0.0.0", "1.0.0", True)
+            ("1.0.1", "2.9.0", "0.0.0", "1.0.0", True),
+            ("not.a.version", "2.9.0", "0.0.0", "1.0.0", True)
             ])
 def test_version_check(manifest_version, data_pipeline_version,
                        cmin, cmax, exception):
@@ -185,6 +246,28 @@ def test_version_check(manifest_version, data_pipeline_version,
         version_check(manifest_version, data_pipeline_version, cmin, cmax)
 
 
+@pytest.mark.parametrize(
+        "data_pipeline, expected",
+        [
+            ([{"name": "AllenSDK", "version": "2.9.0"},
+              {"name": "other", "version": "1.0.0"}], "2.9.0"),
+            ([{"name": "other", "version": "1.0.0"}], None),
+            ([{"name": "AllenSDK", "version": "2.9.0"},
+              {"name": "AllenSDK", "version": "2.10.0"}], None)
+            ])
+def test_get_data_sdk_version(data_pipeline, expected):
+    api = cloudapi.BehaviorProjectCloudApi.__new__(
+        cloudapi.BehaviorProjectCloudApi)
+    api.cache = MagicMock()
+    api.cache._manifest._data_pipeline = data_pipeline
+    if expected is None:
+        with pytest.raises(BehaviorCloudCacheVersionException,
+                           match="expected 1 AllenSDK entry"):
+            api._get_data_sdk_version()
+    else:
+        assert api._get_data_sdk_version() == expected
+
+
 def test_from_local_cache(monkeypatch):
     mock_manifest = create_autospec(Manifest)
     mock_manifest.metadata_file_names = {
@@ -246,3 +329,101 @@ def test_from_local_cache(monkeypatch):
         mock_static_local_cache.assert_called_once_with(
             "second_cache_dir", "project_2", "ui_2"
         )
+
+
+def test_read_metadata_csv_caches_parsed_table(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "ophys_session_table.csv"
+    csv_path.write_text(
+        "ophys_session_id,mouse_id,passed,driver_line,ophys_experiment_id\n"
+        "10,0123,True,\"['Sst-IRES-Cre']\",\"[4, 5]\"\n"
+        "11,,,,[6]\n"
+        "12,456,False,\"['Slc17a7-IRES2-Cre', 'Camk2a-tTA']\",\n")
+
+    df = cloudapi._read_metadata_csv(csv_path, string_columns=["mouse_id"])
+    parsed_paths = list(
+        tmp_path.glob("ophys_session_table.csv.parsed.*.parquet"))
+    assert len(parsed_paths) == 1
+    assert f"allensdk-{cloudapi.allensdk.__version__}" in parsed_paths[0].name
+    assert "strings-mouse_id" in parsed_paths[0].name
+    assert df["ophys_experiment_id"].tolist()[:2] == [[4, 5], [6]]
+
+    # the second read should not need to parse the csv, and should give
+    # the same table
+    def fail(*args, **kwargs):
+        raise AssertionError("csv should not be re-parsed")
+    with monkeypatch.context() as m:
+        m.setattr(cloudapi, "literal_col_eval", fail)
+        cached_df = cloudapi._read_metadata_csv(
+            csv_path, string_columns=["mouse_id"])
+    pd.testing.assert_frame_equal(cached_df, df)
+    assert [type(x) for x in cached_df["ophys_experiment_id"]] == \
+        [type(x) for x in df["ophys_experiment_id"]]
+
+    # a corrupt parsed table is ignored and replaced
+    parsed_paths[0].write_bytes(parsed_paths[0].read_bytes()[:10])
+    pd.testing.assert_frame_equal(
+        cloudapi._read_metadata_csv(csv_path, string_columns=["mouse_id"]),
+        df)
+    pd.read_parquet(parsed_paths[0])
+    assert list(tmp_path.glob("*.tmp")) == []
+
+    # the parsed table depends on string_columns
+    cloudapi._read_metadata_csv(csv_path)
+    assert len(list(
+        tmp_path.glob("ophys_session_table.csv.parsed.*.parquet"))) == 2
+
+
+def test_read_metadata_csv_without_pyarrow_is_not_cached(tmp_path,
+                                                         monkeypatch):
+    monkeypatch.setattr(cloudapi, "pyarrow", None)
+    csv_path = tmp_path / "ophys_session_table.csv"
+    pd.DataFrame({
+        "ophys_session_id": [10, 11],
+        "ophys_experiment_id": [[4, 5], [6]]}).to_csv(csv_path, index=False)
+
+    df = cloudapi._read_metadata_csv(csv_path)
+    assert df["ophys_experiment_id"].tolist() == [[4, 5], [6]]
+    assert list(tmp_path.iterdir()) == [csv_path]
+
+
+@pytest.mark.parametrize(
+        "string_columns, expected_n_reads",
+        [
+            (["mouse_id"], 2),
+            (["mouse_id", "date_of_acquisition", "date"], 1)
+            ])
+def test_read_metadata_csv_readers_agree(tmp_path, monkeypatch,
+                                         string_columns, expected_n_reads):
+    pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "ophys_session_table.csv"
+    csv_path.write_text(
+        "ophys_session_id,mouse_id,date_of_acquisition,date,session_type,"
+        "passed,ophys_experiment_id,empty\n"
+        "10,0123,2021-01-01 10:00:00.123,2021-01-01,None,True,\"[4, 5]\",\n"
+        "11,,2021-01-02 11:00:00.456,2021-01-02,<NA>,,[6],\n"
+        "12,456,,,OPHYS_1,False,,\n")
+
+    # the csv is only read again if pyarrow inferred dates or times
+    read_csv = cloudapi.pyarrow_csv.read_csv
+    n_reads = []
+
+    def counting_read_csv(*args, **kwargs):
+        n_reads.append(1)
+        return read_csv(*args, **kwargs)
+
+    with monkeypatch.context() as m:
+        m.setattr(cloudapi.pyarrow_csv, "read_csv", counting_read_csv)
+        pyarrow_df = cloudapi._read_metadata_csv(
+            csv_path, string_columns=string_columns)
+    assert len(n_reads) == expected_n_reads
+
+    monkeypatch.setattr(cloudapi, "pyarrow", None)
+    pandas_df = cloudapi._read_metadata_csv(
+        csv_path, string_columns=string_columns)
+    pd.testing.assert_frame_equal(pyarrow_df, pandas_df)
+    assert pandas_df["empty"].dtype == float
+    # assert_frame_equal does not tell None from NaN
+    for column in pandas_df.columns:
+        assert [type(x) for x in pyarrow_df[column]] == \
+            [type(x) for x in pandas_df[column]]
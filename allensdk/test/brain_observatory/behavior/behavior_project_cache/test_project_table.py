@@ -0,0 +1,26 @@
+import pandas as pd
+import pytest
+
+from allensdk.brain_observatory.behavior.behavior_project_cache.tables.\
+    project_table import ProjectTable
+
+
+class DummyTable(ProjectTable):
+    def postprocess_additional(self):
+        self._df['a'] = self._df['a'] * 2
+        self._df['c'] = 1
+
+
+@pytest.mark.parametrize('index', [[1, 2, 3], [1, 1, 3]])
+def test_project_table_does_not_modify_input(index):
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]},
+                      index=pd.Index(index, name='id'))
+    expected = df.copy(deep=True)
+
+    table = DummyTable(df=df, suppress=['b'])
+
+    pd.testing.assert_frame_equal(df, expected)
+    assert list(table.table.columns) == ['a', 'c']
+    assert not table.table.index.duplicated().any()
+    assert table.table['a'].tolist() == \
+        [2 * x for x in expected['a'][~expected.index.duplicated()]]
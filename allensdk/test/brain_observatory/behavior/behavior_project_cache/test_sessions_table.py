@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+from allensdk.brain_observatory.behavior.behavior_project_cache.tables.\
+    sessions_table import SessionsTable, _map_unique
+
+
+def _add_session_number(session_types):
+    table = SessionsTable.__new__(SessionsTable)
+    table._df = pd.DataFrame({'session_type': session_types})
+    table._SessionsTable__add_session_number()
+    return table._df['session_number']
+
+
+def test_add_session_number():
+    session_number = _add_session_number(
+        ['OPHYS_1_images_A', 'OPHYS_6_images_B', 'TRAINING_1_gratings',
+         'OPHYS_habituation', None, np.nan])
+    assert session_number.dtype == 'Int64'
+    assert session_number.tolist()[:2] == [1, 6]
+    assert session_number[2:].isna().all()
+
+
+def test_add_session_number_matches_prefix_only():
+    session_number = _add_session_number(
+        ['OPHYS_12_images_A', 'TRAINING_OPHYS_1', 'ophys_1', '_OPHYS_1'])
+    assert session_number[0] == 12
+    assert session_number[1:].isna().all()
+
+
+def test_add_session_number_all_null():
+    session_number = _add_session_number([None, None])
+    assert session_number.dtype == 'Int64'
+    assert session_number.isna().all()
+
+
+def test_map_unique():
+    calls = []
+
+    def parse(value):
+        calls.append(value)
+        return None if pd.isna(value) else value.split('-')[0]
+
+    series = pd.Series(['Ai93-x', 'Ai148-y', 'Ai93-x', np.nan, 'Ai93-x'],
+                       index=[5, 4, 3, 2, 1])
+    result = _map_unique(series, parse)
+
+    pd.testing.assert_series_equal(
+        result, pd.Series(['Ai93', 'Ai148', 'Ai93', None, 'Ai93'],
+                          index=[5, 4, 3, 2, 1]))
+    # parsed once per distinct value
+    assert len(calls) == 3
+
+
+def test_map_unique_unhashable():
+    series = pd.Series([['Ai93', 'Ai94'], ['Ai148'], ['Ai93', 'Ai94']])
+    result = _map_unique(series, lambda x: ';'.join(x))
+    assert result.tolist() == ['Ai93;Ai94', 'Ai148', 'Ai93;Ai94']
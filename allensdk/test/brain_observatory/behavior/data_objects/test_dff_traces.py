@@ -0,0 +1,107 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pynwb
+import pytest
+from pynwb import ProcessingModule
+from pynwb.ophys import ImageSegmentation, OpticalChannel
+
+from allensdk.brain_observatory.behavior.data_objects.cell_specimens\
+    .traces.dff_traces import \
+    DFF_TRACES_CHUNK_BYTES, DFFTraces, _get_chunk_shape
+from allensdk.brain_observatory.behavior.data_objects.timestamps\
+    .ophys_timestamps import \
+    OphysTimestamps
+
+
+@pytest.mark.parametrize("shape", [(0, 10), (10, 0), (0, 0)])
+def test_get_chunk_shape_empty(shape):
+    """Empty trace data cannot be chunked"""
+    assert _get_chunk_shape(np.empty(shape)) is None
+
+
+@pytest.mark.parametrize("shape, dtype, expected", [
+    # fewer than 32 rois: chunks span every roi and all timepoints
+    ((100, 5), np.float64, (100, 5)),
+    ((1, 1), np.float64, (1, 1)),
+    # more than 32 rois: chunks span 32 rois
+    ((100, 400), np.float64, (100, 32)),
+    # chunks are bounded to 1 MiB
+    ((140000, 400), np.float64, (4096, 32)),
+    ((140000, 400), np.float32, (8192, 32)),
+    ((140000, 8), np.float64, (16384, 8)),
+])
+def test_get_chunk_shape(shape, dtype, expected):
+    trace_data = np.zeros(shape, dtype=dtype)
+    chunk_shape = _get_chunk_shape(trace_data)
+
+    assert chunk_shape == expected
+    assert np.prod(chunk_shape) * trace_data.itemsize <= \
+        DFF_TRACES_CHUNK_BYTES
+
+
+class TestNWB:
+    @classmethod
+    def setup_class(cls):
+        cls.ophys_timestamps = OphysTimestamps(
+            timestamps=np.array([0.1, 0.2, 0.3])
+        )
+
+    def setup_method(self, method):
+        self.nwbfile = pynwb.NWBFile(
+            session_description="asession",
+            identifier="1234",
+            session_start_time=datetime.now(),
+        )
+
+        # dff traces are written against the cell specimen table
+        device = self.nwbfile.create_device(name="device")
+        imaging_plane = self.nwbfile.create_imaging_plane(
+            name="imaging_plane_1",
+            optical_channel=OpticalChannel(
+                name="channel_1",
+                description="2P Optical Channel",
+                emission_lambda=520.0,
+            ),
+            description="imaging plane",
+            device=device,
+            excitation_lambda=910.0,
+            imaging_rate=31.0,
+            indicator="GCaMP6f",
+            location="VISp",
+        )
+        image_segmentation = ImageSegmentation(name="image_segmentation")
+        ophys_module = ProcessingModule("ophys", "Ophys processing module")
+        self.nwbfile.add_processing_module(ophys_module)
+        ophys_module.add_data_interface(image_segmentation)
+        image_segmentation.create_plane_segmentation(
+            name="cell_specimen_table",
+            description="Segmented rois",
+            imaging_plane=imaging_plane,
+        )
+
+    @pytest.mark.parametrize("roundtrip", [True, False])
+    def test_read_write_nwb_no_rois(
+        self, roundtrip, data_object_roundtrip_fixture
+    ):
+        dff_traces = DFFTraces(
+            traces=pd.DataFrame(
+                {"dff": []},
+                index=pd.Index(data=[], dtype=int, name="cell_roi_id"),
+            )
+        )
+        dff_traces.to_nwb(
+            nwbfile=self.nwbfile, ophys_timestamps=self.ophys_timestamps
+        )
+
+        if roundtrip:
+            obt = data_object_roundtrip_fixture(
+                nwbfile=self.nwbfile, data_object_cls=DFFTraces
+            )
+        else:
+            obt = DFFTraces.from_nwb(nwbfile=self.nwbfile)
+
+        assert obt.value.empty
+        assert obt.value.index.name == "cell_roi_id"
+        assert list(obt.value.columns) == ["dff"]
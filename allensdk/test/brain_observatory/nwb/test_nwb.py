@@ -1,8 +1,14 @@
 import warnings
 import h5py
+import numpy as np
+import pandas as pd
+import pynwb
 import pytest
+from pynwb import ProcessingModule
+from pynwb.ophys import ImageSegmentation, OpticalChannel
 
-from allensdk.brain_observatory.nwb import check_nwbfile_version
+from allensdk.brain_observatory.nwb import (
+    add_corrected_fluorescence_traces, add_dff_traces, check_nwbfile_version)
 
 
 @pytest.fixture
@@ -55,3 +61,47 @@ def test_check_nwbfile_version(version_only_nwbfile_fixture,
             assert warn_msg in str(w[-1].message)
     else:
         assert len(w) == 0
+
+
+def test_add_traces_no_rois(nwbfile, tmp_path):
+    """Traces are written as timepoints x rois even when there are no rois"""
+    device = nwbfile.create_device(name="device")
+    imaging_plane = nwbfile.create_imaging_plane(
+        name="imaging_plane_1",
+        optical_channel=OpticalChannel(
+            name="channel_1",
+            description="2P Optical Channel",
+            emission_lambda=520.0),
+        description="imaging plane",
+        device=device,
+        excitation_lambda=910.0,
+        imaging_rate=31.0,
+        indicator="GCaMP6f",
+        location="VISp")
+    image_segmentation = ImageSegmentation(name="image_segmentation")
+    ophys_module = ProcessingModule("ophys", "Ophys processing module")
+    nwbfile.add_processing_module(ophys_module)
+    ophys_module.add_data_interface(image_segmentation)
+    image_segmentation.create_plane_segmentation(
+        name="cell_specimen_table",
+        description="Segmented rois",
+        imaging_plane=imaging_plane)
+
+    ophys_timestamps = np.array([0.1, 0.2, 0.3])
+    dff_traces = pd.DataFrame({"cell_roi_id": [], "dff": []})
+    corrected_fluorescence_traces = pd.DataFrame(
+        {"cell_roi_id": [], "corrected_fluorescence": []})
+
+    add_dff_traces(nwbfile, dff_traces, ophys_timestamps)
+    add_corrected_fluorescence_traces(nwbfile, corrected_fluorescence_traces)
+
+    nwb_path = tmp_path / "no_rois.nwb"
+    with pynwb.NWBHDF5IO(str(nwb_path), "w") as write_io:
+        write_io.write(nwbfile)
+
+    with pynwb.NWBHDF5IO(str(nwb_path), "r") as read_io:
+        ophys_module = read_io.read().processing["ophys"]
+        for name in ("dff", "corrected_fluorescence"):
+            traces = ophys_module[name].roi_response_series["traces"]
+            assert traces.data.shape == (len(ophys_timestamps), 0)
+            assert len(traces.rois) == 0
@@ -113,6 +113,19 @@ def test_sanitize_list(
     assert not actual == for_later
 
 
+def test_sanitize_long_list_of_scalars():
+    """
+    Test that _sanitize_list decodes the bytes in a long list that is
+    mostly scalars, leaving the scalars as they are
+    """
+    input_data = [1, 2.5, None, True, 'a', b'b'] * 10000
+    expected_data = [1, 2.5, None, True, 'a', 'b'] * 10000
+
+    actual = _sanitize_list(input_data)
+    assert actual == expected_data
+    assert [type(x) for x in actual] == [type(x) for x in expected_data]
+
+
 @pytest.mark.parametrize('nested', [True, False])
 def test_sanitize_dict(
         dict_data_fixture,
@@ -0,0 +1,51 @@
+import pytest
+import pandas as pd
+
+from allensdk.core.utilities import literal_col_eval
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("[1, 2, 3]", [1, 2, 3]),
+     ("[-4,5,]", [-4, 5]),
+     ("[]", []),
+     ("7", 7),
+     ("-7", -7),
+     ("['Sst-IRES-Cre']", ['Sst-IRES-Cre']),
+     ("[1.5, 2]", [1.5, 2])])
+def test_literal_col_eval(value, expected):
+    df = pd.DataFrame({'a': [value, value, None], 'b': [1, 2, 3]})
+    df = literal_col_eval(df, columns=['a', 'b', 'not_a_column'])
+    assert df['a'].iloc[0] == expected
+    assert df['a'].iloc[1] == expected
+    assert pd.isna(df['a'].iloc[2])
+    assert df['b'].tolist() == [1, 2, 3]
+
+
+def test_literal_col_eval_already_evaluated():
+    df = pd.DataFrame({'a': [[1, 2], [3]]})
+    df = literal_col_eval(df, columns=['a'])
+    assert df['a'].tolist() == [[1, 2], [3]]
+
+
+def test_literal_col_eval_skips_non_string_columns():
+    df = pd.DataFrame({'a': [1.0, None], 'b': [True, False]})
+    df = literal_col_eval(df, columns=['a', 'b'])
+    assert df['a'].dtype == float
+    assert df['b'].dtype == bool
+
+
+def test_literal_col_eval_mixed_object_column():
+    df = pd.DataFrame({'a': [1, True, 1.0, '[1, 2]', '1']})
+    df = literal_col_eval(df, columns=['a'])
+    assert [(type(x), x) for x in df['a']] == [
+        (int, 1), (bool, True), (float, 1.0), (list, [1, 2]), (int, 1)]
+
+
+def test_literal_col_eval_rows_do_not_share_lists():
+    df = pd.DataFrame({'a': ['[1, 2]', '[1, 2]', "[[1], [2]]", "[[1], [2]]"]})
+    df = literal_col_eval(df, columns=['a'])
+    df['a'].iloc[0].append(9)
+    df['a'].iloc[2][0].append(9)
+    assert df['a'].tolist() == [
+        [1, 2, 9], [1, 2], [[1, 9], [2]], [[1], [2]]]